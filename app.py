@@ -1,8 +1,79 @@
+import bisect
+import math
+from typing import NamedTuple
+
+import numpy as np
 import streamlit as st
 import pandas as pd
 
 st.set_page_config(page_title="Thomas App", layout="centered")
 
+# Dollar amount bought on each scoop.
+SCOOP_AMOUNT = 10.0
+
+# Starter portfolios as (upper bound on amount, ((symbol, allocation, est. yield), ...)).
+PORTFOLIOS_BY_TIER = (
+    (250_000, (
+        ("JEPQ", 0.5, 0.11),
+        ("PDI", 0.3, 0.14),
+        ("AGNC", 0.2, 0.13),
+    )),
+    (750_000, (
+        ("JEPQ", 0.3, 0.11),
+        ("PDI", 0.25, 0.14),
+        ("AGNC", 0.2, 0.13),
+        ("SCHD", 0.15, 0.035),
+        ("VYM", 0.1, 0.038),
+    )),
+    (math.inf, (
+        ("JEPQ", 0.2, 0.11),
+        ("PDI", 0.15, 0.14),
+        ("AGNC", 0.1, 0.13),
+        ("SCHD", 0.2, 0.035),
+        ("VYM", 0.15, 0.038),
+        ("O", 0.1, 0.06),
+        ("VTI", 0.1, 0.015),
+    )),
+)
+_TIER_LIMITS = tuple(limit for limit, _ in PORTFOLIOS_BY_TIER)
+
+
+class TomScoreRecord(NamedTuple):
+    headline: str
+    level: str
+    detail: str
+
+
+# TomScore tiers as (record, symbols); flattened into a per-symbol dict at import.
+_TOMSCORE_TABLE = (
+    (TomScoreRecord("5 – High Confidence Income Producer", "success",
+                    "This asset is ideal for frequent skimming and can reliably support income generation."),
+     ("PDI", "JEPQ", "AGNC")),
+    (TomScoreRecord("4 – Reliable Dividend Asset", "info",
+                    "A stable choice that contributes consistent yield, though less aggressive."),
+     ("SCHD", "VYM", "O")),
+    (TomScoreRecord("3 – Growth-Focused", "warning",
+                    "More suitable for long-term holding than monthly income."),
+     ("VTI",)),
+)
+TOMSCORE = {sym: rec for rec, syms in _TOMSCORE_TABLE for sym in syms}
+
+
+@st.cache_data
+def compute_starter(total_amount: int) -> tuple[list[dict], float]:
+    _, portfolio = PORTFOLIOS_BY_TIER[bisect.bisect_right(_TIER_LIMITS, total_amount)]
+
+    alloc = np.array([allocation for _, allocation, _ in portfolio])
+    yields = np.array([est_yield for _, _, est_yield in portfolio])
+    dollars = alloc * total_amount
+    income = dollars * yields
+    rows = [
+        {"Symbol": symbol, "Dollars": float(d), "Income": float(inc)}
+        for (symbol, _, _), d, inc in zip(portfolio, dollars, income)
+    ]
+    return rows, float(income.sum())
+
+
 st.sidebar.title("What do you want Thomas to help you with?")
 page = st.sidebar.radio("Choose a page", [
     "🔵 I already have a portfolio",
@@ -20,37 +91,12 @@ if page == "🟢 Help me build one":
     if total_amount > 0 and monthly_income_goal > 0:
         st.markdown("---")
         st.subheader("📊 Suggested Starter Portfolio")
-        if total_amount < 250_000:
-            portfolio = [
-                {"Symbol": "JEPQ", "Allocation": 0.5, "EstYield": 0.11},
-                {"Symbol": "PDI", "Allocation": 0.3, "EstYield": 0.14},
-                {"Symbol": "AGNC", "Allocation": 0.2, "EstYield": 0.13}
-            ]
-        elif total_amount < 750_000:
-            portfolio = [
-                {"Symbol": "JEPQ", "Allocation": 0.3, "EstYield": 0.11},
-                {"Symbol": "PDI", "Allocation": 0.25, "EstYield": 0.14},
-                {"Symbol": "AGNC", "Allocation": 0.2, "EstYield": 0.13},
-                {"Symbol": "SCHD", "Allocation": 0.15, "EstYield": 0.035},
-                {"Symbol": "VYM", "Allocation": 0.1, "EstYield": 0.038}
-            ]
-        else:
-            portfolio = [
-                {"Symbol": "JEPQ", "Allocation": 0.2, "EstYield": 0.11},
-                {"Symbol": "PDI", "Allocation": 0.15, "EstYield": 0.14},
-                {"Symbol": "AGNC", "Allocation": 0.1, "EstYield": 0.13},
-                {"Symbol": "SCHD", "Allocation": 0.2, "EstYield": 0.035},
-                {"Symbol": "VYM", "Allocation": 0.15, "EstYield": 0.038},
-                {"Symbol": "O", "Allocation": 0.1, "EstYield": 0.06},
-                {"Symbol": "VTI", "Allocation": 0.1, "EstYield": 0.015}
-            ]
-
-        total_annual_income = 0
-        for asset in portfolio:
-            dollars = total_amount * asset["Allocation"]
-            income = dollars * asset["EstYield"]
-            total_annual_income += income
-            st.write(f"{asset['Symbol']}: Invest ${dollars:,.0f}, Est. income: ${income:,.0f}/yr")
+        rows, total_annual_income = compute_starter(int(total_amount))
+        lines = [
+            f"- {row['Symbol']}: Invest \\${row['Dollars']:,.0f}, Est. income: \\${row['Income']:,.0f}/yr"
+            for row in rows
+        ]
+        st.markdown("\n".join(lines))
 
         total_monthly = total_annual_income / 12
         st.markdown(f"### 💵 Estimated Monthly Income: **${total_monthly:,.0f}**")
@@ -88,21 +134,29 @@ elif page == "🔵 I already have a portfolio":
 
     if st.button("Estimate My Income"):
         st.markdown("### 💰 Projected Results")
-        for asset in portfolio:
-            symbol = asset["Symbol"]
-            sh = asset["Shares"]
-            cb = asset["CostBasis"]
-            cp = asset["CurrentPrice"]
-            if cb and cp:
-                gain = (cp - cb) / cb if cb else 0
-                if cp > cb:
-                    proceeds = sh * cp
-                    st.write(f"{symbol}: Estimated Skim – ${proceeds:,.2f}")
-                elif cp < cb:
-                    scoop_qty = round(10 / cp, 2) if cp else 0
-                    st.write(f"{symbol}: Scoop Opportunity – Buy ~{scoop_qty} more @ ${cp:.2f}")
-            else:
-                st.write(f"{symbol}: Based on holdings, Thomas can likely generate monthly income with this asset.")
+        df = pd.DataFrame(portfolio, columns=["Symbol", "Shares", "CostBasis", "CurrentPrice"]).astype(
+            {"Shares": "float64", "CostBasis": "float64", "CurrentPrice": "float64"}
+        )
+        priced = (df.CostBasis != 0) & (df.CurrentPrice != 0)
+        df["Proceeds"] = df.Shares * df.CurrentPrice
+        df["ScoopQty"] = np.round(SCOOP_AMOUNT / df.CurrentPrice.where(df.CurrentPrice != 0, 1), 2)
+        # np.select takes the first matching condition, so the price checks
+        # only ever apply to priced rows.
+        cond = [
+            ~priced,
+            df.CurrentPrice > df.CostBasis,
+            df.CurrentPrice < df.CostBasis,
+        ]
+        df["Action"] = np.select(cond, ["Income", "Skim", "Scoop"], default="No action")
+        lines = []
+        for row in df.itertuples(index=False):
+            if row.Action == "Skim":
+                lines.append(f"- {row.Symbol}: Estimated Skim – \\${row.Proceeds:,.2f}")
+            elif row.Action == "Scoop":
+                lines.append(f"- {row.Symbol}: Scoop Opportunity – Buy ~{row.ScoopQty} more @ \\${row.CurrentPrice:.2f}")
+            elif row.Action == "Income":
+                lines.append(f"- {row.Symbol}: Based on holdings, Thomas can likely generate monthly income with this asset.")
+        st.markdown("\n".join(lines))
 
 elif page == "🟠 I'm curious about a specific stock":
     st.title("🟠 I'm Curious About a Stock")
@@ -110,15 +164,10 @@ elif page == "🟠 I'm curious about a specific stock":
     if symbol:
         sym = symbol.upper()
         st.markdown(f"### 🔍 TomScore for {sym}")
-        if sym in ["PDI", "JEPQ", "AGNC"]:
-            st.success("5 – High Confidence Income Producer")
-            st.write("This asset is ideal for frequent skimming and can reliably support income generation.")
-        elif sym in ["SCHD", "VYM", "O"]:
-            st.info("4 – Reliable Dividend Asset")
-            st.write("A stable choice that contributes consistent yield, though less aggressive.")
-        elif sym == "VTI":
-            st.warning("3 – Growth-Focused")
-            st.write("More suitable for long-term holding than monthly income.")
+        rec = TOMSCORE.get(sym)
+        if rec:
+            getattr(st, rec.level)(rec.headline)
+            st.write(rec.detail)
         else:
             st.error("1 – Not optimized for Skim/Scoop")
             st.write("This asset may not support reliable income through Thomas.")